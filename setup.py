@@ -1,19 +1,30 @@
 """Setup configuration for Green Needle audio transcription system."""
 
-from setuptools import setup, find_packages
-import os
+import ast
+import functools
+from pathlib import Path
+
+from setuptools import setup
 
 # Read the README file
 with open("README.md", "r", encoding="utf-8") as fh:
     long_description = fh.read()
 
-# Read requirements
+# Read requirements (cached; called once per extras entry)
+@functools.lru_cache(maxsize=None)
 def read_requirements(filename):
     with open(filename, "r", encoding="utf-8") as f:
-        return [line.strip() for line in f if line.strip() and not line.startswith("#")]
+        return tuple(line.strip() for line in f if line.strip() and not line.startswith("#"))
+
+# Get version (statically parsed, no exec of version.py)
+def read_version(filename="src/green_needle/version.py"):
+    tree = ast.parse(Path(filename).read_text(encoding="utf-8"))
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and node.targets[0].id == "__version__":
+            return node.value.value
+    raise RuntimeError(f"No __version__ found in {filename}")
 
-# Get version
-exec(open("src/green_needle/version.py").read())
+__version__ = read_version()
 
 setup(
     name="green-needle",
@@ -24,7 +35,7 @@ setup(
     long_description=long_description,
     long_description_content_type="text/markdown",
     url="https://github.com/yourusername/green-needle",
-    packages=find_packages(where="src"),
+    packages=["green_needle"],
     package_dir={"": "src"},
     classifiers=[
         "Development Status :: 4 - Beta",
@@ -1,15 +1,38 @@
 """Green Needle - High-quality local audio transcription using OpenAI Whisper."""
 
-from .transcriber import Transcriber
-from .recorder import AudioRecorder
-from .pipeline import Pipeline
-from .batch_processor import BatchProcessor
+import importlib
+
 from .version import __version__
 
+# Heavy classes are resolved lazily (PEP 562) so that importing the package
+# (e.g. for --version) does not pull in whisper/torch/sounddevice.
+_LAZY_IMPORTS = {
+    "Transcriber": ("green_needle.transcriber", "Transcriber"),
+    "AudioRecorder": ("green_needle.recorder", "AudioRecorder"),
+    "Pipeline": ("green_needle.pipeline", "Pipeline"),
+    "BatchProcessor": ("green_needle.batch_processor", "BatchProcessor"),
+}
+
 __all__ = [
     "Transcriber",
-    "AudioRecorder", 
+    "AudioRecorder",
     "Pipeline",
     "BatchProcessor",
     "__version__"
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    """Resolve heavy submodule classes on first access."""
+    try:
+        module_name, attr_name = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name), attr_name)
+    globals()[name] = value  # Cache so __getattr__ only fires once per name
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
@@ -1,19 +1,134 @@
 """Batch processing functionality for multiple audio files."""
 
+import fnmatch
+import functools
 import logging
+import os
+import queue
+import threading
+import time
+from collections import Counter, deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Union, Callable
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from datetime import datetime
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
 
 from tqdm import tqdm
 
 from .transcriber import Transcriber
-from .utils import format_size, get_audio_duration
+from .result import TranscriptionResult
+from .utils import count_words, format_size, get_audio_duration, split_audio_file
 from .exceptions import BatchProcessingError
 
 logger = logging.getLogger(__name__)
 
+# File extensions accepted by batch processing (also used by the CLI)
+AUDIO_EXTENSIONS = frozenset({
+    '.mp3', '.wav', '.m4a', '.flac', '.ogg', '.opus', '.webm',
+    '.mp4', '.avi', '.mkv'
+})
+
+
+def _iter_audio_files(root, pattern="*", recursive=False):
+    """Yield audio file Paths under root, cheapest checks first.
+
+    Walks with os.scandir so the file/dir distinction comes from the
+    readdir result instead of a stat per entry, and only entries that
+    pass the extension and pattern checks are promoted to Path objects.
+    """
+    pending = deque([os.fspath(root)])
+
+    while pending:
+        current = pending.popleft()
+        try:
+            entries = os.scandir(current)
+        except OSError as e:
+            logger.warning(f"Cannot scan {current}: {e}")
+            continue
+
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if recursive:
+                        pending.append(entry.path)
+                    continue
+
+                name = entry.name
+                stem, dot, ext = name.rpartition('.')
+                if (dot and f'.{ext.lower()}' in AUDIO_EXTENSIONS
+                        and fnmatch.fnmatch(name, pattern)
+                        and entry.is_file()):
+                    yield Path(entry.path)
+
+
+def _throttle_progress(
+    callback: Callable[[int, int], None],
+    min_interval: float = 0.02
+) -> Callable[[int, int], None]:
+    """Wrap a progress callback so it fires at most ~1/min_interval Hz.
+
+    Rich/tqdm renderers take a lock per update; for batches of
+    thousands of short files that lock traffic is pure overhead. The
+    final update (completed == total) is always delivered.
+    """
+    last_emit = 0.0
+
+    def wrapper(completed: int, total: int):
+        nonlocal last_emit
+        now = time.perf_counter()
+        if completed == total or now - last_emit >= min_interval:
+            last_emit = now
+            callback(completed, total)
+
+    return wrapper
+
+
+def _decode_audio(file_path):
+    """Decode an audio file to Whisper's 16 kHz mono float32 format.
+
+    Module-level so it can be pickled into ProcessPoolExecutor workers;
+    the decode (ffmpeg + resample) is CPU-bound Python/numpy work that
+    the GIL would otherwise serialize across threads.
+    """
+    import whisper
+    return whisper.load_audio(str(file_path))
+
+
+@dataclass
+class _ReportAccumulator:
+    """Running aggregates for a batch, updated as each file completes.
+
+    Keeps report generation a single streaming pass instead of
+    re-walking the full results list once per statistic.
+    """
+    total_files: int = 0
+    successful: int = 0
+    failed: int = 0
+    total_duration: float = 0.0
+    total_processing_time: float = 0.0
+    total_words: int = 0
+    languages: Counter = field(default_factory=Counter)
+    failures: List[Dict[str, Any]] = field(default_factory=list)
+
+    def add(self, result: Dict[str, Any]):
+        """Fold one per-file result dict into the running totals."""
+        self.total_files += 1
+        if result.get('success'):
+            self.successful += 1
+            self.total_duration += result.get('duration', 0)
+            self.total_processing_time += result.get('processing_time', 0)
+            self.total_words += result.get('word_count', 0)
+            self.languages[result.get('language', 'unknown')] += 1
+        else:
+            self.failed += 1
+            self.failures.append(result)
+
 
 class BatchProcessor:
     """Process multiple audio files efficiently."""
@@ -41,9 +156,76 @@ class BatchProcessor:
         self.output_format = output_format
         self.num_workers = num_workers
         self.chunk_size = chunk_size
-        
-        # Keep transcriber instances for reuse
-        self._transcribers = {}
+
+        # Checkout/checkin pool of transcribers, bounded to num_workers
+        # instances and populated lazily on demand
+        self._transcriber_pool = queue.Queue(maxsize=num_workers)
+        self._transcriber_count = 0
+        self._transcriber_lock = threading.Lock()
+
+        # Persistent worker pool, created on first parallel batch and
+        # reused across process_files calls
+        self._executor = None
+
+        # Process pool for audio decode; decoding file N+1 overlaps
+        # with inference on file N. Created lazily from worker threads,
+        # so creation is guarded by its own lock.
+        self._decode_pool = None
+        self._decode_pool_lock = threading.Lock()
+
+        # Aggregates from the most recent process_files call
+        self._last_report = None
+
+        # Recycled result dicts for the streaming (collect_results=False)
+        # path; keeps per-file allocations down to the Whisper tensors
+        self._result_pool = queue.Queue(maxsize=4 * num_workers)
+
+    def _new_result(self) -> Dict[str, Any]:
+        """Take a result dict from the pool, or allocate a fresh one."""
+        try:
+            result = self._result_pool.get_nowait()
+            result.clear()
+            return result
+        except queue.Empty:
+            return {}
+
+    def _recycle_result(self, result: Dict[str, Any]):
+        """Return a result dict to the pool once its fields are consumed."""
+        try:
+            self._result_pool.put_nowait(result)
+        except queue.Full:
+            pass
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Get or create the persistent worker pool."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.num_workers,
+                thread_name_prefix="green-needle-batch"
+            )
+        return self._executor
+
+    def _get_decode_pool(self) -> ProcessPoolExecutor:
+        """Get or create the audio-decode process pool."""
+        if self._decode_pool is None:
+            # Worker threads race to create the pool on first use; the
+            # lock keeps losers from overwriting (and leaking) the
+            # winner's executor and its child processes
+            with self._decode_pool_lock:
+                if self._decode_pool is None:
+                    self._decode_pool = ProcessPoolExecutor(
+                        max_workers=self.num_workers
+                    )
+        return self._decode_pool
+
+    def shutdown(self):
+        """Shut down the worker pools, waiting for in-flight work."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        if self._decode_pool is not None:
+            self._decode_pool.shutdown(wait=True)
+            self._decode_pool = None
     
     def process_files(
         self,
@@ -52,100 +234,169 @@ class BatchProcessor:
         language: Optional[str] = None,
         progress_callback: Optional[Callable[[int, int], None]] = None,
         skip_existing: bool = True,
+        collect_results: bool = True,
         **transcribe_kwargs
     ) -> List[Dict[str, Any]]:
         """
         Process multiple audio files.
-        
+
         Args:
             input_files: List of audio file paths
             output_dir: Output directory for transcriptions
             language: Language code for transcription
             progress_callback: Callback for progress updates
             skip_existing: Skip files that already have transcriptions
+            collect_results: Keep per-file result dicts and return them.
+                When False, results are folded into the report
+                aggregates only and their dicts are recycled, keeping
+                memory constant for very large batches.
             **transcribe_kwargs: Additional arguments for transcription
-            
+
         Returns:
-            List of result dictionaries
+            List of result dictionaries (empty if collect_results=False)
         """
         output_dir = Path(output_dir)
         output_dir.mkdir(parents=True, exist_ok=True)
         
-        # Filter files
+        # Snapshot existing output stems once; one directory listing
+        # instead of a stat round-trip per input file
+        existing_stems = set()
+        if skip_existing:
+            try:
+                with os.scandir(output_dir) as entries:
+                    suffix = f".{self.output_format}"
+                    existing_stems = {
+                        e.name[:-len(suffix)] for e in entries
+                        if e.name.endswith(suffix)
+                    }
+            except OSError:
+                pass
+
+        # Filter files, capturing size and duration in the same pass so
+        # _process_single_file never re-stats or re-probes a file
         files_to_process = []
         for file_path in input_files:
             file_path = Path(file_path)
-            
-            if not file_path.exists():
+
+            try:
+                file_size = file_path.stat().st_size
+            except OSError:
                 logger.warning(f"File not found: {file_path}")
                 continue
-            
+
             # Check if already processed
-            output_path = output_dir / f"{file_path.stem}.{self.output_format}"
-            if skip_existing and output_path.exists():
+            if skip_existing and file_path.stem in existing_stems:
                 logger.info(f"Skipping existing: {file_path.name}")
                 continue
-            
-            files_to_process.append(file_path)
+
+            files_to_process.append(
+                (file_path, file_size, get_audio_duration(file_path))
+            )
         
         if not files_to_process:
             logger.info("No files to process")
             return []
         
         logger.info(f"Processing {len(files_to_process)} files with {self.num_workers} workers")
+
+        if progress_callback:
+            progress_callback = _throttle_progress(progress_callback)
+
+        # Bind the per-batch arguments once instead of rebuilding the
+        # kwargs dict on every call/submission
+        process_one = functools.partial(
+            self._process_single_file,
+            output_dir=output_dir,
+            language=language,
+            **transcribe_kwargs
+        )
         
-        # Process files
+        # Process files, folding each result into the running report
+        # aggregates as it arrives
         results = []
         completed = 0
+        report = _ReportAccumulator()
+        self._last_report = report
         
         if self.num_workers == 1:
             # Sequential processing
-            for file_path in files_to_process:
-                result = self._process_single_file(
+            for file_path, file_size, duration in files_to_process:
+                result = process_one(
                     file_path,
-                    output_dir,
-                    language,
-                    **transcribe_kwargs
+                    file_size=file_size,
+                    duration=duration
                 )
-                results.append(result)
-                
+                report.add(result)
+                if collect_results:
+                    results.append(result)
+                elif result.get('success'):
+                    # Failures stay referenced by the report accumulator
+                    self._recycle_result(result)
+
                 completed += 1
                 if progress_callback:
                     progress_callback(completed, len(files_to_process))
         else:
-            # Parallel processing
-            with ThreadPoolExecutor(max_workers=self.num_workers) as executor:
-                # Submit tasks
-                future_to_file = {
-                    executor.submit(
-                        self._process_single_file,
+            # Parallel processing on the persistent pool. The pool runs
+            # the transcribe-dominated per-file work (which releases the
+            # GIL inside Whisper); progress dispatch and result
+            # aggregation stay here on the calling thread.
+            executor = self._get_executor()
+
+            # Submit lazily with a bounded number of in-flight futures
+            # so a 10k-file batch does not queue 10k tasks (and their
+            # argument/result references) up-front
+            max_in_flight = 2 * self.num_workers
+            pending_files = iter(files_to_process)
+            future_to_file = {}
+
+            def submit_next() -> bool:
+                for file_path, file_size, duration in pending_files:
+                    future = executor.submit(
+                        process_one,
                         file_path,
-                        output_dir,
-                        language,
-                        **transcribe_kwargs
-                    ): file_path
-                    for file_path in files_to_process
-                }
-                
-                # Process results as they complete
-                for future in as_completed(future_to_file):
-                    file_path = future_to_file[future]
-                    
+                        file_size=file_size,
+                        duration=duration
+                    )
+                    future_to_file[future] = file_path
+                    return True
+                return False
+
+            while len(future_to_file) < max_in_flight and submit_next():
+                pass
+
+            # Drain completed futures in batches; one wait() call per
+            # wakeup instead of re-entering as_completed's waiter (and
+            # its lock) for every single completion
+            while future_to_file:
+                done, _ = wait(future_to_file, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    file_path = future_to_file.pop(future)
+
                     try:
                         result = future.result()
-                        results.append(result)
                     except Exception as e:
                         logger.error(f"Failed to process {file_path}: {str(e)}")
-                        results.append({
+                        result = {
                             'file': str(file_path),
                             'success': False,
                             'error': str(e)
-                        })
-                    
+                        }
+                    report.add(result)
+                    if collect_results:
+                        results.append(result)
+                    elif result.get('success'):
+                        # Failures stay referenced by the accumulator
+                        self._recycle_result(result)
+
                     completed += 1
                     if progress_callback:
                         progress_callback(completed, len(files_to_process))
-        
+
+                    # Refill the in-flight window
+                    submit_next()
+
         return results
     
     def _process_single_file(
@@ -153,68 +404,183 @@ class BatchProcessor:
         file_path: Path,
         output_dir: Path,
         language: Optional[str] = None,
+        file_size: Optional[int] = None,
+        duration: Optional[float] = None,
         **transcribe_kwargs
     ) -> Dict[str, Any]:
-        """Process a single audio file."""
-        start_time = datetime.now()
-        
+        """Process a single audio file.
+
+        file_size and duration are normally precomputed by the filter
+        pass in process_files; they are re-derived only when this method
+        is called directly.
+
+        Threading note: the stages that dominate runtime all release
+        the GIL — ffprobe/decode wait in subprocess or the decode pool,
+        and Transcriber.transcribe runs under torch.inference_mode()
+        whose kernels drop the GIL. Keep it that way; adding Python-side
+        heavy work here serializes the whole pool.
+        """
+        # Monotonic timer: immune to wall-clock adjustments mid-batch
+        start_time = time.perf_counter()
+
         try:
-            # Get or create transcriber
-            transcriber = self._get_transcriber()
-            
             # Check file size and duration
-            file_size = file_path.stat().st_size
-            duration = get_audio_duration(file_path)
-            
+            if file_size is None:
+                file_size = file_path.stat().st_size
+            if duration is None:
+                duration = get_audio_duration(file_path)
+
             logger.info(f"Processing: {file_path.name} "
                        f"(size: {format_size(file_size)}, "
                        f"duration: {duration:.1f}s)")
             
-            # Transcribe
-            result = transcriber.transcribe(
-                file_path,
-                language=language,
-                **transcribe_kwargs
-            )
-            
+            # Long files are split into chunks so memory stays bounded
+            # and chunk transcriptions from different files interleave
+            if self.chunk_size and duration > self.chunk_size:
+                result = self._transcribe_chunked(
+                    file_path,
+                    language,
+                    **transcribe_kwargs
+                )
+            else:
+                # In parallel mode, decode in a worker process so the
+                # CPU-bound ffmpeg/numpy prep for the next file overlaps
+                # inference on the current one; threads only wait on
+                # the decode future (GIL released).
+                if self.num_workers > 1:
+                    audio = self._get_decode_pool().submit(
+                        _decode_audio, file_path
+                    ).result()
+                else:
+                    audio = file_path
+
+                # Transcribe with a pooled transcriber
+                with self._borrow_transcriber() as transcriber:
+                    result = transcriber.transcribe(
+                        audio,
+                        language=language,
+                        **transcribe_kwargs
+                    )
+
+                # A decoded array carries no path, so the transcriber
+                # records a placeholder; restore the real source file
+                # before the result is saved
+                result.audio_path = str(file_path)
+
             # Save result
             output_path = output_dir / f"{file_path.stem}.{self.output_format}"
             result.save(output_path, format=self.output_format)
             
             # Calculate processing time
-            processing_time = (datetime.now() - start_time).total_seconds()
-            
-            return {
-                'file': str(file_path),
-                'success': True,
-                'output': str(output_path),
-                'duration': duration,
-                'processing_time': processing_time,
-                'real_time_factor': processing_time / duration if duration > 0 else 0,
-                'language': result.language,
-                'word_count': len(result.text.split())
-            }
-            
+            processing_time = time.perf_counter() - start_time
+
+            result_info = self._new_result()
+            result_info.update(
+                file=str(file_path),
+                success=True,
+                output=str(output_path),
+                duration=duration,
+                processing_time=processing_time,
+                real_time_factor=processing_time / duration if duration > 0 else 0,
+                language=result.language,
+                word_count=count_words(result.text)
+            )
+            return result_info
+
         except Exception as e:
             logger.error(f"Error processing {file_path}: {str(e)}")
-            return {
-                'file': str(file_path),
-                'success': False,
-                'error': str(e)
-            }
-    
-    def _get_transcriber(self) -> Transcriber:
-        """Get or create a transcriber instance."""
-        # Simple round-robin for now
-        worker_id = len(self._transcribers)
-        
-        if worker_id not in self._transcribers:
-            self._transcribers[worker_id] = Transcriber(
-                model=self.model,
-                device=self.device
+            result_info = self._new_result()
+            result_info.update(
+                file=str(file_path),
+                success=False,
+                error=str(e)
             )
-        
-        return self._transcribers[worker_id]
+            return result_info
+    
+    def _transcribe_chunked(
+        self,
+        file_path: Path,
+        language: Optional[str] = None,
+        **transcribe_kwargs
+    ) -> TranscriptionResult:
+        """Transcribe a long file as chunk_size-second chunks.
+
+        Chunks are cut with ffmpeg at chunk_size boundaries, transcribed
+        in order, and merged back into one TranscriptionResult with
+        segment timestamps shifted by each chunk's offset. The language
+        detected on the first chunk is pinned for the rest so detection
+        does not flap between chunks.
+        """
+        chunk_paths = split_audio_file(file_path, chunk_duration=self.chunk_size)
+        texts = []
+        segments = []
+        total_duration = 0.0
+
+        for i, chunk_path in enumerate(chunk_paths):
+            with self._borrow_transcriber() as transcriber:
+                chunk_result = transcriber.transcribe(
+                    chunk_path,
+                    language=language,
+                    **transcribe_kwargs
+                )
+
+            offset = i * self.chunk_size
+            for segment in chunk_result.segments:
+                segment['start'] += offset
+                segment['end'] += offset
+
+            texts.append(chunk_result.text.strip())
+            segments.extend(chunk_result.segments)
+            total_duration += chunk_result.duration
+
+            if language is None:
+                language = chunk_result.language
+
+            # Remove the temporary chunk once transcribed
+            if chunk_path != file_path:
+                chunk_path.unlink(missing_ok=True)
+
+        return TranscriptionResult(
+            text=" ".join(texts),
+            segments=segments,
+            language=language,
+            duration=total_duration,
+            audio_path=str(file_path),
+            model=self.model,
+            task=transcribe_kwargs.get('task', 'transcribe')
+        )
+
+    @contextmanager
+    def _borrow_transcriber(self):
+        """Check a transcriber out of the pool for one transcribe call.
+
+        At most num_workers Transcriber instances ever exist; they are
+        created lazily as demand appears and returned to the pool after
+        use. Each instance serves one call at a time. The shared model
+        cache may hand every instance the same underlying model, in
+        which case the openai backend serializes decodes on the model's
+        own lock (whisper keeps per-call attention-cache hooks on the
+        model's modules); faster-whisper backends run concurrently.
+        """
+        try:
+            transcriber = self._transcriber_pool.get_nowait()
+        except queue.Empty:
+            transcriber = None
+            with self._transcriber_lock:
+                if self._transcriber_count < max(self.num_workers, 1):
+                    self._transcriber_count += 1
+                    transcriber = Transcriber(
+                        model=self.model,
+                        device=self.device
+                    )
+            if transcriber is None:
+                # Pool is at capacity; wait for a checkin
+                transcriber = self._transcriber_pool.get()
+
+        try:
+            yield transcriber
+        finally:
+            self._transcriber_pool.put(transcriber)
     
     def process_directory(
         self,
@@ -238,16 +604,9 @@ class BatchProcessor:
             List of result dictionaries
         """
         input_dir = Path(input_dir)
-        
+
         # Find audio files
-        audio_extensions = {'.mp3', '.wav', '.m4a', '.flac', '.ogg', '.opus', '.webm', '.mp4', '.avi', '.mkv'}
-        
-        if recursive:
-            files = [f for f in input_dir.rglob(pattern) 
-                    if f.is_file() and f.suffix.lower() in audio_extensions]
-        else:
-            files = [f for f in input_dir.glob(pattern) 
-                    if f.is_file() and f.suffix.lower() in audio_extensions]
+        files = list(_iter_audio_files(input_dir, pattern, recursive))
         
         if not files:
             logger.warning(f"No audio files found in {input_dir}")
@@ -257,49 +616,58 @@ class BatchProcessor:
         
         return self.process_files(files, output_dir, **kwargs)
     
-    def generate_report(self, results: List[Dict[str, Any]]) -> str:
-        """Generate a summary report of batch processing results."""
-        total_files = len(results)
-        successful = sum(1 for r in results if r['success'])
-        failed = total_files - successful
-        
-        if successful > 0:
-            success_results = [r for r in results if r['success']]
-            total_duration = sum(r.get('duration', 0) for r in success_results)
-            total_processing_time = sum(r.get('processing_time', 0) for r in success_results)
-            total_words = sum(r.get('word_count', 0) for r in success_results)
-            avg_rtf = total_processing_time / total_duration if total_duration > 0 else 0
-            
-            report = f"""
+    def generate_report(self, results: Optional[List[Dict[str, Any]]] = None) -> str:
+        """Generate a summary report of batch processing results.
+
+        With no arguments, formats the aggregates streamed during the
+        most recent process_files call. An explicit results list is
+        folded into a fresh accumulator in a single pass.
+        """
+        if results is None:
+            acc = self._last_report or _ReportAccumulator()
+        else:
+            acc = _ReportAccumulator()
+            for r in results:
+                acc.add(r)
+
+        return self._format_report(acc)
+
+    @staticmethod
+    def _format_report(acc: _ReportAccumulator) -> str:
+        """Format accumulated batch statistics as a text report."""
+        if acc.successful == 0:
+            return "No files were successfully processed."
+
+        avg_rtf = (acc.total_processing_time / acc.total_duration
+                   if acc.total_duration > 0 else 0)
+
+        # Build as a list and join once; += concatenation is quadratic
+        # when thousands of language/failure lines are appended
+        lines = [f"""
 Batch Processing Report
 ======================
-Total files: {total_files}
-Successful: {successful}
-Failed: {failed}
+Total files: {acc.total_files}
+Successful: {acc.successful}
+Failed: {acc.failed}
 
 Processing Statistics:
-- Total audio duration: {total_duration:.1f} seconds
-- Total processing time: {total_processing_time:.1f} seconds
+- Total audio duration: {acc.total_duration:.1f} seconds
+- Total processing time: {acc.total_processing_time:.1f} seconds
 - Average real-time factor: {avg_rtf:.2f}x
-- Total words transcribed: {total_words:,}
-
-Language Distribution:
-"""
-            # Count languages
-            languages = {}
-            for r in success_results:
-                lang = r.get('language', 'unknown')
-                languages[lang] = languages.get(lang, 0) + 1
-            
-            for lang, count in sorted(languages.items(), key=lambda x: x[1], reverse=True):
-                report += f"- {lang}: {count} files\n"
-            
-            if failed > 0:
-                report += "\nFailed Files:\n"
-                for r in results:
-                    if not r['success']:
-                        report += f"- {r['file']}: {r.get('error', 'Unknown error')}\n"
-        else:
-            report = "No files were successfully processed."
-        
-        return report
\ No newline at end of file
+- Total words transcribed: {acc.total_words:,}
+
+Language Distribution:"""]
+
+        lines.extend(
+            f"- {lang}: {count} files"
+            for lang, count in acc.languages.most_common()
+        )
+
+        if acc.failed > 0:
+            lines.append("\nFailed Files:")
+            lines.extend(
+                f"- {r['file']}: {r.get('error', 'Unknown error')}"
+                for r in acc.failures
+            )
+
+        return "\n".join(lines) + "\n"
\ No newline at end of file
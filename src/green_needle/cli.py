@@ -6,29 +6,29 @@ from pathlib import Path
 from typing import Optional, List
 import click
 from rich.console import Console
-from rich.table import Table
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.logging import RichHandler
 
-from .transcriber import Transcriber
-from .recorder import AudioRecorder
-from .batch_processor import BatchProcessor
+# The Whisper/torch stack (via Transcriber and friends) and the heavier
+# rich modules are imported inside the commands that need them, so
+# `green-needle --help`, `config --show`, etc. stay fast.
 from .config import Config
-from .utils import format_size, setup_logging
 from .version import __version__
 
 console = Console()
 
-# Set up logging with Rich
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(message)s",
-    handlers=[RichHandler(console=console, rich_tracebacks=True)]
-)
-
 logger = logging.getLogger(__name__)
 
 
+def _setup_rich_logging():
+    """Route logging through Rich; called once the CLI actually runs."""
+    from rich.logging import RichHandler
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(message)s",
+        handlers=[RichHandler(console=console, rich_tracebacks=True)]
+    )
+
+
 @click.group()
 @click.version_option(version=__version__, prog_name="green-needle")
 @click.option("--config", "-c", type=click.Path(exists=True), help="Config file path")
@@ -44,7 +44,9 @@ def cli(ctx, config, verbose, quiet):
     """
     # Set up context
     ctx.ensure_object(dict)
-    
+
+    _setup_rich_logging()
+
     # Load configuration
     if config:
         ctx.obj["config"] = Config.from_file(config)
@@ -79,6 +81,10 @@ def cli(ctx, config, verbose, quiet):
 def transcribe(ctx, audio_file, model, language, task, output, format, device, 
                temperature, initial_prompt, word_timestamps):
     """Transcribe an audio file."""
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
+    from .transcriber import Transcriber
+
     console.print(f"\n[bold blue]Transcribing:[/bold blue] {audio_file}")
     
     # Initialize transcriber
@@ -135,6 +141,12 @@ def transcribe(ctx, audio_file, model, language, task, output, format, device,
 @click.pass_context
 def record(ctx, duration, output, sample_rate, channels, device, transcribe, model):
     """Record audio from microphone."""
+    from rich.progress import Progress
+    from rich.table import Table
+
+    from .recorder import AudioRecorder
+    from .utils import format_size
+
     # Initialize recorder
     recorder = AudioRecorder(
         sample_rate=sample_rate,
@@ -196,8 +208,10 @@ def record(ctx, duration, output, sample_rate, channels, device, transcribe, mod
     
     # Transcribe if requested
     if transcribe:
+        from .transcriber import Transcriber
+
         console.print(f"\n[bold blue]Transcribing recording...[/bold blue]")
-        
+
         transcriber = Transcriber(model=model)
         result = transcriber.transcribe(audio_path)
         
@@ -206,7 +220,7 @@ def record(ctx, duration, output, sample_rate, channels, device, transcribe, mod
         result.save(transcript_path)
         
         console.print(f"\n[bold green]✓ Transcription saved:[/bold green] {transcript_path}")
-        console.print(f"Words: {len(result.text.split()):,}")
+        console.print(f"Words: {result.word_count:,}")
 
 
 @cli.command()
@@ -220,18 +234,15 @@ def record(ctx, duration, output, sample_rate, channels, device, transcribe, mod
 @click.pass_context
 def batch(ctx, input_dir, output_dir, model, format, pattern, recursive, num_workers):
     """Process multiple audio files."""
+    from rich.progress import Progress
+
+    from .batch_processor import BatchProcessor, _iter_audio_files
+
     input_path = Path(input_dir)
     output_path = Path(output_dir)
-    
+
     # Find audio files
-    if recursive:
-        audio_files = list(input_path.rglob(pattern))
-    else:
-        audio_files = list(input_path.glob(pattern))
-    
-    # Filter to audio files
-    audio_extensions = {'.mp3', '.wav', '.m4a', '.flac', '.ogg', '.opus', '.webm'}
-    audio_files = [f for f in audio_files if f.suffix.lower() in audio_extensions]
+    audio_files = list(_iter_audio_files(input_path, pattern, recursive))
     
     if not audio_files:
         console.print(f"[red]No audio files found matching pattern: {pattern}[/red]")
@@ -247,31 +258,55 @@ def batch(ctx, input_dir, output_dir, model, format, pattern, recursive, num_wor
     )
     
     # Process files
-    with Progress(console=console) as progress:
-        task = progress.add_task("Processing files...", total=len(audio_files))
-        
+    if num_workers > 1:
+        # Rich's live renderer takes a lock per update; with many
+        # workers completing concurrently it becomes a contention
+        # point, so fall back to periodic log lines
+        import time
+
+        last_log = [0.0]
+
         def update_progress(completed, total):
-            progress.update(task, completed=completed)
-        
+            now = time.perf_counter()
+            if completed == total or now - last_log[0] >= 1.0:
+                last_log[0] = now
+                logger.info(f"Processed {completed}/{total} files")
+
         results = processor.process_files(
             audio_files,
             output_path,
             progress_callback=update_progress
         )
+    else:
+        with Progress(console=console) as progress:
+            task = progress.add_task("Processing files...", total=len(audio_files))
+
+            def update_progress(completed, total):
+                progress.update(task, completed=completed)
+
+            results = processor.process_files(
+                audio_files,
+                output_path,
+                progress_callback=update_progress
+            )
     
-    # Show summary
-    successful = len([r for r in results if r['success']])
-    failed = len([r for r in results if not r['success']])
-    
+    # Show summary (single pass over the results)
+    successful = 0
+    failures = []
+    for result in results:
+        if result['success']:
+            successful += 1
+        else:
+            failures.append(result)
+
     console.print(f"\n[bold green]✓ Batch processing complete![/bold green]")
     console.print(f"Successful: {successful}")
-    if failed > 0:
-        console.print(f"[red]Failed: {failed}[/red]")
-        
+    if failures:
+        console.print(f"[red]Failed: {len(failures)}[/red]")
+
         # Show failed files
-        for result in results:
-            if not result['success']:
-                console.print(f"  - {result['file']}: {result.get('error', 'Unknown error')}")
+        for result in failures:
+            console.print(f"  - {result['file']}: {result.get('error', 'Unknown error')}")
 
 
 @cli.command()
@@ -281,6 +316,8 @@ def batch(ctx, input_dir, output_dir, model, format, pattern, recursive, num_wor
 def models(list_models, download, info):
     """Manage Whisper models."""
     if list_models:
+        from rich.table import Table
+
         console.print("\n[bold]Available Whisper Models:[/bold]\n")
         
         models_info = [
@@ -2,12 +2,17 @@
 
 import os
 from pathlib import Path
-from typing import Dict, Any, Optional, Union
+from typing import ClassVar, Dict, Any, Optional, Union
 import yaml
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field, fields
 
 from .exceptions import ConfigError
 
+# Use the libyaml C implementations when PyYAML was built with them;
+# they parse and emit several times faster than the pure-Python classes.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 
 @dataclass
 class WhisperConfig:
@@ -45,6 +50,20 @@ class ProcessingConfig:
     auto_split: bool = True
     
 
+# Field names per section dataclass, resolved once. asdict() re-runs
+# dataclass introspection (and deep-copies values) on every call; the
+# section configs are flat, so iterating cached names is all we need.
+_FIELDS = {
+    cls: tuple(f.name for f in fields(cls))
+    for cls in (WhisperConfig, AudioConfig, OutputConfig, ProcessingConfig)
+}
+
+
+def _section_dict(section) -> Dict[str, Any]:
+    """Build a plain dict from a flat section dataclass."""
+    return {name: getattr(section, name) for name in _FIELDS[type(section)]}
+
+
 @dataclass
 class Config:
     """Main configuration class."""
@@ -61,9 +80,11 @@ class Config:
             raise ConfigError(f"Configuration file not found: {path}")
         
         try:
-            with open(path, 'r') as f:
-                data = yaml.safe_load(f) or {}
-            
+            # One read() syscall; handing bytes to the loader also lets
+            # libyaml scan them directly instead of pulling buffered
+            # reads through a Python file object
+            data = yaml.load(path.read_bytes(), Loader=_YAML_LOADER) or {}
+
             # Create nested configs
             config = cls()
             
@@ -81,46 +102,100 @@ class Config:
         except Exception as e:
             raise ConfigError(f"Failed to load configuration: {str(e)}")
     
+    @classmethod
+    def from_file_header(cls, path: Union[str, Path],
+                         sections: tuple) -> "Config":
+        """
+        Load only the named top-level sections from a YAML file.
+
+        Reads lines until a top-level key outside ``sections`` appears,
+        so unrelated sections are never parsed — useful when e.g. CLI
+        override resolution only needs a couple of keys. Falls back to
+        a full :meth:`from_file` parse if the partial text does not
+        contain every requested section.
+        """
+        path = Path(path)
+        if not path.exists():
+            raise ConfigError(f"Configuration file not found: {path}")
+
+        section_types = {
+            'whisper': WhisperConfig,
+            'audio': AudioConfig,
+            'output': OutputConfig,
+            'processing': ProcessingConfig
+        }
+
+        lines = []
+        with open(path, 'r') as f:
+            for line in f:
+                head = line[:1]
+                if head and head not in ' \t\n#' and ':' in line:
+                    if line.split(':', 1)[0].strip() not in sections:
+                        break
+                lines.append(line)
+
+        try:
+            data = yaml.load(''.join(lines), Loader=_YAML_LOADER) or {}
+            config = cls()
+            for name in sections:
+                setattr(config, name, section_types[name](**data[name]))
+            return config
+        except (KeyError, TypeError, yaml.YAMLError):
+            # Requested section lives below an unrelated key, or the
+            # partial text did not stand alone — parse the whole file
+            return cls.from_file(path)
+
     def save(self, path: Union[str, Path]):
         """Save configuration to YAML file."""
         path = Path(path)
         path.parent.mkdir(parents=True, exist_ok=True)
         
         data = {
-            'whisper': asdict(self.whisper),
-            'audio': asdict(self.audio),
-            'output': asdict(self.output),
-            'processing': asdict(self.processing)
+            'whisper': _section_dict(self.whisper),
+            'audio': _section_dict(self.audio),
+            'output': _section_dict(self.output),
+            'processing': _section_dict(self.processing)
         }
-        
+
         with open(path, 'w') as f:
-            yaml.dump(data, f, default_flow_style=False)
+            yaml.dump(data, f, Dumper=_YAML_DUMPER, default_flow_style=False)
     
     def to_yaml(self) -> str:
         """Convert configuration to YAML string."""
         data = {
-            'whisper': asdict(self.whisper),
-            'audio': asdict(self.audio),
-            'output': asdict(self.output),
-            'processing': asdict(self.processing)
+            'whisper': _section_dict(self.whisper),
+            'audio': _section_dict(self.audio),
+            'output': _section_dict(self.output),
+            'processing': _section_dict(self.processing)
         }
-        
-        return yaml.dump(data, default_flow_style=False)
+
+        return yaml.dump(data, Dumper=_YAML_DUMPER, default_flow_style=False)
     
+    # Parsed dot-notation keys, shared across instances; CLI option
+    # resolution asks for the same handful of keys over and over.
+    _PATH_CACHE: ClassVar[Dict[str, tuple]] = {}
+
     def get(self, key: str, default: Any = None) -> Any:
         """Get configuration value by dot-notation key."""
-        parts = key.split('.')
+        parts = self._PATH_CACHE.get(key)
+        if parts is None:
+            parts = self._PATH_CACHE[key] = tuple(key.split('.'))
+
+        if len(parts) == 2:
+            # Hot path: 'section.field' is two getattr calls
+            section = getattr(self, parts[0], None)
+            if section is None:
+                return default
+            return getattr(section, parts[1], default)
+
         value = self
-        
-        try:
-            for part in parts:
-                if hasattr(value, part):
-                    value = getattr(value, part)
-                else:
-                    return default
-            return value
-        except:
-            return default
+
+        for part in parts:
+            if hasattr(value, part):
+                value = getattr(value, part)
+            else:
+                return default
+        return value
     
     def set(self, key: str, value: Any):
         """Set configuration value by dot-notation key."""
@@ -157,13 +232,15 @@ class Config:
     
     def merge(self, other: "Config"):
         """Merge another configuration into this one."""
-        for section in ['whisper', 'audio', 'output', 'processing']:
+        for section in ('whisper', 'audio', 'output', 'processing'):
             other_section = getattr(other, section)
             self_section = getattr(self, section)
-            
-            for key, value in asdict(other_section).items():
+
+            # Copy attributes directly; no intermediate dict needed
+            for name in _FIELDS[type(other_section)]:
+                value = getattr(other_section, name)
                 if value is not None:
-                    setattr(self_section, key, value)
+                    setattr(self_section, name, value)
 
 
 # Default configuration template
@@ -1,6 +1,7 @@
 """Audio processing pipeline for Green Needle."""
 
 import logging
+import re
 from typing import List, Dict, Any, Optional, Union, Callable
 from pathlib import Path
 from abc import ABC, abstractmethod
@@ -31,43 +32,66 @@ class Pipeline:
     def __init__(self, processors: List[Processor]):
         """
         Initialize pipeline with list of processors.
-        
+
         Args:
             processors: List of Processor instances
         """
         self.processors = processors
-    
+        self._run = None
+
+    def _compile_runner(self):
+        """
+        Generate a straight-line runner for the current stages.
+
+        The pipeline shape is fixed between add/remove calls, so the
+        per-stage loop — with its iterator protocol and a try/except
+        frame set up for every stage — is replaced by generated code
+        that chains the bound process methods directly. The runner
+        records the current stage index in `trace` before each call so
+        process() can name the failing stage from its single handler.
+        """
+        namespace = {
+            f'_p{i}': p.process for i, p in enumerate(self.processors)
+        }
+        body = ''.join(
+            f'    trace[0] = {i}\n    data = _p{i}(data)\n'
+            for i in range(len(self.processors))
+        )
+        source = f'def _run(data, trace):\n{body}    return data\n'
+        exec(source, namespace)
+        self._run = namespace['_run']
+        return self._run
+
     def process(self, input_data: Any) -> Any:
         """
         Process data through all pipeline stages.
-        
+
         Args:
             input_data: Initial input data
-            
+
         Returns:
             Final processed result
         """
-        result = input_data
-        
-        for processor in self.processors:
-            logger.debug(f"Running processor: {processor}")
-            try:
-                result = processor.process(result)
-            except Exception as e:
-                raise AudioProcessingError(
-                    f"Pipeline failed at {processor}: {str(e)}"
-                )
-        
-        return result
-    
+        run = self._run or self._compile_runner()
+        trace = [-1]
+
+        try:
+            return run(input_data, trace)
+        except Exception as e:
+            raise AudioProcessingError(
+                f"Pipeline failed at {self.processors[trace[0]]}: {str(e)}"
+            )
+
     def add_processor(self, processor: Processor):
         """Add a processor to the pipeline."""
         self.processors.append(processor)
-    
+        self._run = None
+
     def remove_processor(self, processor_type: type):
         """Remove processors of a specific type."""
-        self.processors = [p for p in self.processors 
+        self.processors = [p for p in self.processors
                           if not isinstance(p, processor_type)]
+        self._run = None
     
     def __repr__(self):
         stages = " -> ".join(repr(p) for p in self.processors)
@@ -89,12 +113,18 @@ class processors:
             
             audio, sr = sf.read(str(file_path))
             
-            # Resample if necessary
+            # Resample if necessary. soxr wraps the SIMD-optimized
+            # libsoxr C library and is several times faster than
+            # librosa's resampy/scipy backends on this hot path.
             if sr != self.sample_rate:
-                import librosa
-                audio = librosa.resample(
-                    audio, orig_sr=sr, target_sr=self.sample_rate
-                )
+                try:
+                    import soxr
+                    audio = soxr.resample(audio, sr, self.sample_rate)
+                except ImportError:
+                    import librosa
+                    audio = librosa.resample(
+                        audio, orig_sr=sr, target_sr=self.sample_rate
+                    )
             
             return {
                 'audio': audio,
@@ -110,9 +140,13 @@ class processors:
             self.prop_decrease = prop_decrease
         
         def process(self, data: Dict[str, Any]) -> Dict[str, Any]:
+            if self.prop_decrease <= 0:
+                # Nothing to reduce; skip the full-size output copy
+                return data
+
             try:
                 import noisereduce as nr
-                
+
                 audio = data['audio']
                 sr = data['sample_rate']
                 
@@ -136,7 +170,10 @@ class processors:
         
         def __init__(self, aggressiveness: int = 1):
             self.aggressiveness = aggressiveness
-        
+            # Reused int16 conversion buffer; reallocating a full-size
+            # array per call doubles peak memory on long files
+            self._int16_scratch = None
+
         def process(self, data: Dict[str, Any]) -> Dict[str, Any]:
             import webrtcvad
             
@@ -144,23 +181,36 @@ class processors:
             audio = data['audio']
             sample_rate = data['sample_rate']
             
-            # Convert to 16-bit PCM
+            # Convert to 16-bit PCM (skipped when the audio already is),
+            # writing into the reusable scratch buffer
             if audio.dtype != np.int16:
-                audio = (audio * 32767).astype(np.int16)
+                scratch = self._int16_scratch
+                if scratch is None or scratch.shape != audio.shape:
+                    scratch = self._int16_scratch = np.empty(
+                        audio.shape, dtype=np.int16)
+                np.multiply(audio, 32767, out=scratch, casting='unsafe')
+                audio = scratch
             
-            # Process in 30ms frames
+            # Process in 30ms frames. Reshaping into a (n_frames,
+            # frame_length) view and gathering voiced frames with a
+            # boolean mask keeps the copying in numpy instead of
+            # extending a Python list sample by sample.
             frame_duration = 30  # ms
             frame_length = int(sample_rate * frame_duration / 1000)
-            
-            voiced_frames = []
-            for i in range(0, len(audio) - frame_length, frame_length):
-                frame = audio[i:i + frame_length].tobytes()
-                if vad.is_speech(frame, sample_rate):
-                    voiced_frames.extend(audio[i:i + frame_length])
-            
-            data['audio'] = np.array(voiced_frames, dtype=audio.dtype)
+
+            n_frames = len(audio) // frame_length
+            frames = audio[:n_frames * frame_length].reshape(
+                n_frames, frame_length)
+
+            mask = np.fromiter(
+                (vad.is_speech(frame.tobytes(), sample_rate)
+                 for frame in frames),
+                dtype=bool, count=n_frames
+            )
+
+            data['audio'] = frames[mask].reshape(-1)
             data['vad_applied'] = True
-            
+
             return data
     
     class WhisperTranscription(Processor):
@@ -174,21 +224,43 @@ class processors:
         def process(self, data: Union[Dict[str, Any], str, Path]) -> Dict[str, Any]:
             # Handle different input types
             if isinstance(data, (str, Path)):
-                file_path = data
+                audio_input = data
             elif isinstance(data, dict) and 'file_path' in data:
-                file_path = data['file_path']
+                audio_input = data['file_path']
             else:
-                # Save audio to temporary file
-                import tempfile
-                import soundfile as sf
-                
-                with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as tmp:
-                    sf.write(tmp.name, data['audio'], data['sample_rate'])
-                    file_path = tmp.name
-            
+                # Hand the decoded buffer straight to the transcriber
+                # (it accepts 16 kHz float32 arrays); writing a temp WAV
+                # just for whisper to re-read and re-decode it costs two
+                # extra passes over the audio plus disk I/O
+                audio_input = data['audio']
+                if np.issubdtype(audio_input.dtype, np.integer):
+                    # Integer PCM (e.g. VoiceActivityDetection emits
+                    # int16) must be rescaled to the [-1, 1] range the
+                    # model expects; a bare astype would hand it
+                    # amplitudes tens of thousands of times too large
+                    scale = float(np.iinfo(audio_input.dtype).max) + 1.0
+                    audio_input = audio_input.astype(np.float32) / scale
+                elif audio_input.dtype != np.float32:
+                    audio_input = audio_input.astype(np.float32)
+
+                # Whisper's own resampler only runs on the file path,
+                # so arrays have to arrive at 16 kHz already
+                sample_rate = data.get('sample_rate', 16000)
+                if sample_rate != 16000:
+                    try:
+                        import soxr
+                        audio_input = soxr.resample(
+                            audio_input, sample_rate, 16000)
+                    except ImportError:
+                        import librosa
+                        audio_input = librosa.resample(
+                            audio_input, orig_sr=sample_rate,
+                            target_sr=16000
+                        )
+
             # Transcribe
-            result = self.transcriber.transcribe(file_path, **self.kwargs)
-            
+            result = self.transcriber.transcribe(audio_input, **self.kwargs)
+
             # Return enriched data
             if isinstance(data, dict):
                 data['transcription'] = result
@@ -197,7 +269,7 @@ class processors:
                 return data
             else:
                 return {
-                    'file_path': str(file_path),
+                    'file_path': str(data),
                     'transcription': result,
                     'text': result.text,
                     'segments': result.segments
@@ -205,7 +277,18 @@ class processors:
     
     class TextPostProcessing(Processor):
         """Post-process transcribed text."""
-        
+
+        # Compiled once at class creation; process() runs per file and
+        # should not pay re.compile (or the re-cache lookup) each call.
+        _FILLER_WORDS = ('um', 'uh', 'like', 'you know', 'er', 'ah')
+        _FILLER_ALT = '|'.join(map(re.escape, _FILLER_WORDS))
+        # One linear scan per pattern instead of three str.replace
+        # passes per filler word (18 full-text scans)
+        _FILLER_RE = re.compile(r' (?:' + _FILLER_ALT + r'),?(?= )')
+        _FILLER_DOT_RE = re.compile(r' (?:' + _FILLER_ALT + r')\.(?= )')
+        _PUNCT_RE = re.compile(r' ([,.?!:;])')
+        _CAP_RE = re.compile(r'([.!?]\s*)([a-z])')
+
         def __init__(
             self,
             fix_punctuation: bool = True,
@@ -220,26 +303,17 @@ class processors:
             text = data.get('text', '')
             
             if self.remove_filler_words:
-                filler_words = ['um', 'uh', 'like', 'you know', 'er', 'ah']
-                for filler in filler_words:
-                    text = text.replace(f' {filler} ', ' ')
-                    text = text.replace(f' {filler}, ', ' ')
-                    text = text.replace(f' {filler}. ', '. ')
+                text = self._FILLER_RE.sub('', text)
+                text = self._FILLER_DOT_RE.sub('.', text)
             
             if self.fix_punctuation:
-                # Basic punctuation fixes
-                text = text.replace(' ,', ',')
-                text = text.replace(' .', '.')
-                text = text.replace(' ?', '?')
-                text = text.replace(' !', '!')
-                text = text.replace(' :', ':')
-                text = text.replace(' ;', ';')
-            
+                # Strip the space before punctuation in one pass
+                text = self._PUNCT_RE.sub(r'\1', text)
+
             if self.capitalize_sentences:
-                import re
                 # Capitalize first letter after sentence endings
-                text = re.sub(r'([.!?]\s*)([a-z])', 
-                             lambda m: m.group(1) + m.group(2).upper(), text)
+                text = self._CAP_RE.sub(
+                    lambda m: m.group(1) + m.group(2).upper(), text)
                 # Capitalize first letter
                 if text and text[0].islower():
                     text = text[0].upper() + text[1:]
@@ -249,30 +323,32 @@ class processors:
     
     class Summarization(Processor):
         """Summarize long transcripts."""
-        
+
+        _SENT_RE = re.compile(r'[^.!?]+[.!?]')
+
         def __init__(self, max_length: int = 500, min_length: int = 100):
             self.max_length = max_length
             self.min_length = min_length
-        
+
         def process(self, data: Dict[str, Any]) -> Dict[str, Any]:
             text = data.get('text', '')
-            
+
             # Simple extractive summarization
-            # In production, you might use transformers or other NLP libraries
-            sentences = text.split('. ')
-            
-            if len(sentences) <= 5:
+            # In production, you might use transformers or other NLP libraries.
+            # Only four sentences survive, so collect (start, end) spans
+            # and slice those four out of the transcript instead of
+            # materializing every sentence with str.split.
+            spans = [m.span() for m in self._SENT_RE.finditer(text)]
+
+            if len(spans) <= 5:
                 data['summary'] = text
             else:
                 # Take first and last sentences plus some from middle
-                summary_sentences = [
-                    sentences[0],
-                    sentences[len(sentences)//3],
-                    sentences[2*len(sentences)//3],
-                    sentences[-1]
-                ]
-                data['summary'] = '. '.join(summary_sentences) + '.'
-            
+                n = len(spans)
+                picked = (spans[0], spans[n//3], spans[2*n//3], spans[-1])
+                data['summary'] = ' '.join(
+                    text[s:e].strip() for s, e in picked)
+
             return data
     
     class SaveToFile(Processor):
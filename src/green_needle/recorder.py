@@ -4,7 +4,6 @@ import os
 import time
 import wave
 import threading
-import queue
 import logging
 from pathlib import Path
 from typing import Optional, Callable, Union
@@ -19,6 +18,10 @@ from .exceptions import RecordingError
 
 logger = logging.getLogger(__name__)
 
+# Cached result of AudioRecorder.list_devices; device enumeration is a
+# PortAudio round-trip and the device set rarely changes mid-run.
+_input_device_cache = None
+
 
 class AudioRecorder:
     """Record audio from microphone with support for long recordings."""
@@ -47,7 +50,6 @@ class AudioRecorder:
         # Recording state
         self._recording = False
         self._pause = False
-        self._audio_queue = queue.Queue()
         self._recording_thread = None
         
         # Validate audio setup
@@ -122,19 +124,53 @@ class AudioRecorder:
         """Worker thread for recording."""
         try:
             start_time = time.time()
-            audio_data = []
+            n_samples = 0
             silence_start = None
-            
+            # Compare mean-square energy against the squared threshold;
+            # equivalent to rms < threshold without a sqrt per chunk.
+            silence_threshold_sq = silence_threshold * silence_threshold
+
+            # Ring buffer between the PortAudio callback and this
+            # thread. The callback must not allocate or take locks
+            # (queue.Queue does both, and indata.copy() allocates), so
+            # it writes into preallocated storage and publishes the
+            # cursor; a single int store is atomic under the GIL. The
+            # consumer snapshots the cursor and drains up to it.
+            ring_len = max(int(self.sample_rate * 2.0), 1)
+            ring = np.empty((ring_len, self.channels), dtype=self.dtype)
+            write_idx = 0   # total samples written (monotonic)
+            read_idx = 0    # total samples consumed (worker-local)
+            data_ready = threading.Event()
+
             def audio_callback(indata, frames, time_info, status):
                 """Callback for audio stream."""
+                nonlocal write_idx
                 if status:
                     logger.warning(f"Audio callback status: {status}")
-                
+
                 if self._recording and not self._pause:
-                    self._audio_queue.put(indata.copy())
-            
-            # Open audio stream
-            with sd.InputStream(
+                    k = indata.shape[0]
+                    w = write_idx % ring_len
+                    end = w + k
+                    if end <= ring_len:
+                        ring[w:end] = indata
+                    else:
+                        split = ring_len - w
+                        ring[w:] = indata[:split]
+                        ring[:end - ring_len] = indata[split:]
+                    write_idx += k
+                    data_ready.set()
+
+            # Stream chunks straight to disk as they arrive; buffering
+            # the whole recording in memory makes multi-hour sessions
+            # O(duration) resident and ends with one huge blocking write.
+            with sf.SoundFile(
+                str(output_path),
+                mode='w',
+                samplerate=self.sample_rate,
+                channels=self.channels,
+                subtype='PCM_16'
+            ) as fout, sd.InputStream(
                 samplerate=self.sample_rate,
                 channels=self.channels,
                 device=self.device,
@@ -142,13 +178,44 @@ class AudioRecorder:
                 callback=audio_callback
             ):
                 logger.info("Recording started")
-                
+
                 while self._recording:
                     try:
-                        # Get audio chunk with timeout
-                        chunk = self._audio_queue.get(timeout=0.1)
-                        audio_data.append(chunk)
-                        
+                        # Wait for the callback to publish new samples
+                        if read_idx == write_idx:
+                            if not data_ready.wait(timeout=0.1):
+                                continue
+                            data_ready.clear()
+
+                        available = write_idx - read_idx
+                        if available == 0:
+                            # The event can be set while we are still
+                            # draining, so a wakeup does not guarantee
+                            # unread samples; skip the empty chunk
+                            continue
+                        if available > ring_len:
+                            # Consumer fell more than a full ring
+                            # behind; the oldest samples were overrun
+                            logger.warning(
+                                f"Dropped {available - ring_len} samples "
+                                f"(disk writer lagging)"
+                            )
+                            read_idx = write_idx - ring_len
+                            available = ring_len
+
+                        r = read_idx % ring_len
+                        end = r + available
+                        if end <= ring_len:
+                            chunk = ring[r:end]
+                        else:
+                            chunk = np.concatenate(
+                                (ring[r:], ring[:end - ring_len]))
+                        read_idx += available
+
+                        fout.write(chunk)
+                        n_samples += available
+
+
                         # Calculate elapsed time
                         elapsed = time.time() - start_time
                         
@@ -164,9 +231,10 @@ class AudioRecorder:
                         
                         # Silence detection
                         if auto_stop_silence:
-                            rms = np.sqrt(np.mean(chunk**2))
-                            
-                            if rms < silence_threshold:
+                            flat = chunk.ravel()
+                            energy = np.dot(flat, flat) / flat.size
+
+                            if energy < silence_threshold_sq:
                                 if silence_start is None:
                                     silence_start = time.time()
                                 elif time.time() - silence_start >= silence_duration:
@@ -174,25 +242,13 @@ class AudioRecorder:
                                     break
                             else:
                                 silence_start = None
-                    
-                    except queue.Empty:
-                        continue
+
                     except Exception as e:
                         logger.error(f"Recording error: {str(e)}")
                         break
             
-            # Combine audio data
-            if audio_data:
-                audio_array = np.concatenate(audio_data, axis=0)
-                
-                # Save audio file
-                sf.write(
-                    str(output_path),
-                    audio_array,
-                    self.sample_rate,
-                    subtype='PCM_16'
-                )
-                
+            # The SoundFile context already flushed everything to disk
+            if n_samples:
                 duration_str = str(timedelta(seconds=int(time.time() - start_time)))
                 size_str = format_size(output_path.stat().st_size)
                 logger.info(f"Recording saved: {output_path} "
@@ -235,21 +291,32 @@ class AudioRecorder:
         return self._pause
     
     @staticmethod
-    def list_devices():
-        """List available audio devices."""
-        devices = sd.query_devices()
-        input_devices = []
-        
-        for i, device in enumerate(devices):
-            if device['max_input_channels'] > 0:
-                input_devices.append({
-                    'index': i,
-                    'name': device['name'],
-                    'channels': device['max_input_channels'],
-                    'sample_rate': device['default_samplerate']
-                })
-        
-        return input_devices
+    def list_devices(refresh: bool = False):
+        """
+        List available audio devices.
+
+        Args:
+            refresh: Re-enumerate devices instead of using the cached
+                result (e.g. after plugging in hardware)
+        """
+        global _input_device_cache
+
+        if _input_device_cache is None or refresh:
+            input_devices = []
+
+            for i, device in enumerate(sd.query_devices()):
+                if device['max_input_channels'] > 0:
+                    input_devices.append({
+                        'index': i,
+                        'name': device['name'],
+                        'channels': device['max_input_channels'],
+                        'sample_rate': device['default_samplerate']
+                    })
+
+            _input_device_cache = input_devices
+
+        # Shallow copy so callers can't mutate the cache
+        return list(_input_device_cache)
     
     def record_interactive(
         self,
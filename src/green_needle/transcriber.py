@@ -2,11 +2,15 @@
 
 import os
 import logging
+import threading
+import time
 import warnings
+import weakref
+from collections import OrderedDict
+from operator import itemgetter
 from typing import Dict, List, Optional, Union, Callable, Any
 from pathlib import Path
 import json
-from datetime import datetime
 
 import whisper
 import torch
@@ -22,34 +26,83 @@ warnings.filterwarnings("ignore", message="FP16 is not supported on CPU")
 
 logger = logging.getLogger(__name__)
 
+# Loaded models shared across Transcriber instances, keyed by
+# (model_name, device, backend, download_root) and storing the model
+# together with its resolved backend and an inference lock. Checkpoints
+# are 1-3 GB; reloading one per instance (parametrized tests, worker
+# pools) re-reads the file, re-unpickles and re-uploads to the device
+# every time. Vanilla whisper keeps per-call decoder state on the model
+# (kv-cache forward hooks), so a shared openai model carries a lock
+# that serializes inference across the instances holding it;
+# CTranslate2 models are safe to call concurrently and carry None.
+_MODEL_CACHE: Dict[tuple, tuple] = {}
+# Serializes loads: concurrent first uses (e.g. BatchProcessor worker
+# threads) block on one load instead of each pulling a private copy.
+_MODEL_LOCK = threading.Lock()
+
 
 class Transcriber:
     """Main transcription engine using OpenAI Whisper models."""
     
     AVAILABLE_MODELS = ["tiny", "base", "small", "medium", "large"]
     SUPPORTED_FORMATS = ["txt", "json", "srt", "vtt", "tsv", "all"]
+
+    # Log-mel spectrograms for language detection, keyed by file
+    # identity (path, mtime, size) and kept on CPU. The mel is an STFT
+    # over 30s of audio; repeated detect_language calls on the same
+    # unchanged file skip the decode and transform entirely.
+    _MEL_CACHE: "OrderedDict[tuple, Any]" = OrderedDict()
+    _MEL_CACHE_SIZE = 16
     
     def __init__(
         self,
         model: str = "base",
         device: Optional[str] = None,
         download_root: Optional[str] = None,
-        in_memory: bool = True
+        in_memory: bool = True,
+        backend: str = "auto"
     ):
         """
         Initialize the transcriber with specified model.
-        
+
         Args:
             model: Whisper model size (tiny, base, small, medium, large)
             device: Device to use (cuda, cpu, or None for auto-detect)
             download_root: Directory to download models to
             in_memory: Keep model in memory between transcriptions
+            backend: Inference backend: 'faster' (CTranslate2, int8 on
+                CPU / fp16 on CUDA), 'openai' (vanilla whisper), or
+                'auto' to use faster-whisper when it is installed
         """
+        if backend not in ("auto", "faster", "openai"):
+            raise ValueError(f"Unknown backend: {backend}")
+
         self.model_name = model
         self.device = self._get_device(device)
         self.download_root = download_root
         self.in_memory = in_memory
+        self.backend = backend
+        self._backend = "openai"
         self._model = None
+        self._infer_lock = None
+
+        # A finalizer instead of __del__: it cannot resurrect the
+        # instance and is safe during interpreter shutdown. empty_cache
+        # is a no-op (but still a CUDA call) on other devices, so only
+        # register it where it does something.
+        if self.device == "cuda":
+            self._finalizer = weakref.finalize(self, _release_cuda_cache)
+
+        # Options that rarely change between calls, packed once per
+        # Transcriber instead of per transcribe() call; any of them can
+        # still be overridden per call through **kwargs.
+        self._default_transcribe_opts = {
+            "compression_ratio_threshold": 2.4,
+            "logprob_threshold": -1.0,
+            "no_speech_threshold": 0.6,
+            "prepend_punctuations": r'"\'¿([{-',
+            "append_punctuations": r'"\'.。,，!！?？:：")]}、',
+        }
         
         logger.info(f"Initializing Transcriber with model '{model}' on device '{self.device}'")
         
@@ -71,22 +124,75 @@ class Transcriber:
             logger.info("Using CPU")
             return "cpu"
     
-    def _load_model(self) -> whisper.Whisper:
-        """Load the Whisper model."""
-        try:
-            logger.info(f"Loading Whisper model '{self.model_name}'...")
-            model = whisper.load_model(
-                self.model_name,
-                device=self.device,
-                download_root=self.download_root
-            )
-            logger.info("Model loaded successfully")
+    def _load_model(self):
+        """Load the Whisper model, reusing a cached copy when possible."""
+        key = (self.model_name, self.device, self.backend,
+               self.download_root)
+        cached = _MODEL_CACHE.get(key)
+        if cached is not None:
+            model, self._backend, self._infer_lock = cached
+            logger.info(f"Reusing already-loaded model '{self.model_name}'")
             return model
-        except Exception as e:
-            raise ModelLoadError(f"Failed to load model '{self.model_name}': {str(e)}")
+
+        # Double-checked: threads that raced past the unlocked lookup
+        # wait here and find the model the winner loaded.
+        with _MODEL_LOCK:
+            cached = _MODEL_CACHE.get(key)
+            if cached is not None:
+                model, self._backend, self._infer_lock = cached
+                logger.info(
+                    f"Reusing already-loaded model '{self.model_name}'")
+                return model
+
+            # CTranslate2 runs the same weights quantized (int8 on CPU,
+            # fp16 on CUDA) at a fraction of the cost of vanilla
+            # whisper. MPS is not supported by CTranslate2, so 'auto'
+            # skips it there.
+            if self.backend in ("auto", "faster") and self.device != "mps":
+                try:
+                    from faster_whisper import WhisperModel
+                except ImportError:
+                    if self.backend == "faster":
+                        raise ModelLoadError(
+                            "backend='faster' requires the faster-whisper "
+                            "package (pip install faster-whisper)"
+                        )
+                else:
+                    logger.info(
+                        f"Loading Whisper model '{self.model_name}' "
+                        f"via faster-whisper...")
+                    compute_type = (
+                        "int8" if self.device == "cpu" else "float16")
+                    model = WhisperModel(
+                        self.model_name,
+                        device=self.device,
+                        compute_type=compute_type,
+                        download_root=self.download_root
+                    )
+                    self._backend = "faster"
+                    self._infer_lock = None
+                    logger.info("Model loaded successfully")
+                    _MODEL_CACHE[key] = (model, self._backend,
+                                         self._infer_lock)
+                    return model
+
+            try:
+                logger.info(f"Loading Whisper model '{self.model_name}'...")
+                model = whisper.load_model(
+                    self.model_name,
+                    device=self.device,
+                    download_root=self.download_root
+                )
+                self._infer_lock = threading.Lock()
+                logger.info("Model loaded successfully")
+                _MODEL_CACHE[key] = (model, self._backend,
+                                     self._infer_lock)
+                return model
+            except Exception as e:
+                raise ModelLoadError(f"Failed to load model '{self.model_name}': {str(e)}")
     
     @property
-    def model(self) -> whisper.Whisper:
+    def model(self) -> Any:
         """Get the loaded model, loading it if necessary."""
         if self._model is None:
             self._model = self._load_model()
@@ -94,18 +200,13 @@ class Transcriber:
     
     def transcribe(
         self,
-        audio_path: Union[str, Path],
+        audio_path: Union[str, Path, np.ndarray],
         language: Optional[str] = None,
         task: str = "transcribe",
         temperature: Union[float, List[float]] = 0.0,
-        compression_ratio_threshold: float = 2.4,
-        logprob_threshold: float = -1.0,
-        no_speech_threshold: float = 0.6,
         condition_on_previous_text: bool = True,
         initial_prompt: Optional[str] = None,
         word_timestamps: bool = False,
-        prepend_punctuations: str = r'"\'¿([{-',
-        append_punctuations: str = r'"\'.。,，!！?？:：")]}、',
         verbose: Optional[bool] = None,
         progress_callback: Optional[Callable[[float], None]] = None,
         **kwargs
@@ -114,67 +215,84 @@ class Transcriber:
         Transcribe an audio file.
         
         Args:
-            audio_path: Path to the audio file
+            audio_path: Path to the audio file, or a 16 kHz mono float32
+                waveform that has already been decoded
             language: Language code (e.g., 'en', 'es', 'fr')
             task: Task to perform ('transcribe' or 'translate')
             temperature: Temperature for sampling
-            compression_ratio_threshold: Threshold for compression ratio
-            logprob_threshold: Threshold for log probability
-            no_speech_threshold: Threshold for no speech detection
             condition_on_previous_text: Whether to condition on previous text
             initial_prompt: Initial prompt to help with transcription
             word_timestamps: Whether to include word-level timestamps
-            prepend_punctuations: Punctuations to prepend
-            append_punctuations: Punctuations to append
             verbose: Whether to display progress
             progress_callback: Callback function for progress updates
-            **kwargs: Additional arguments passed to whisper.transcribe
+            **kwargs: Additional arguments passed to whisper.transcribe,
+                including overrides for the preset options
+                (compression_ratio_threshold, logprob_threshold,
+                no_speech_threshold, prepend/append_punctuations)
             
         Returns:
             TranscriptionResult object containing the transcription
         """
-        audio_path = Path(audio_path)
-        if not audio_path.exists():
-            raise FileNotFoundError(f"Audio file not found: {audio_path}")
-        
-        logger.info(f"Starting transcription of: {audio_path}")
-        start_time = datetime.now()
+        if isinstance(audio_path, np.ndarray):
+            audio_input = audio_path
+            source = "<in-memory audio>"
+        else:
+            audio_path = Path(audio_path)
+            if not audio_path.exists():
+                raise FileNotFoundError(f"Audio file not found: {audio_path}")
+            audio_input = str(audio_path)
+            source = str(audio_path)
+
+        logger.info(f"Starting transcription of: {source}")
+        start_time = time.perf_counter()
         
         try:
             # Set up progress tracking
             if verbose is None:
                 verbose = progress_callback is not None
             
-            # Prepare transcription options
+            # Prepare transcription options: splat the preset dict and
+            # layer only the per-call values (and overrides) on top
             options = {
+                **self._default_transcribe_opts,
                 "language": language,
                 "task": task,
                 "temperature": temperature,
-                "compression_ratio_threshold": compression_ratio_threshold,
-                "logprob_threshold": logprob_threshold,
-                "no_speech_threshold": no_speech_threshold,
                 "condition_on_previous_text": condition_on_previous_text,
                 "initial_prompt": initial_prompt,
                 "word_timestamps": word_timestamps,
-                "prepend_punctuations": prepend_punctuations,
-                "append_punctuations": append_punctuations,
                 "verbose": verbose,
                 **kwargs
             }
             
-            # Perform transcription
-            if progress_callback:
+            # Perform transcription. inference_mode skips autograd
+            # tracking, and the torch kernels underneath release the
+            # GIL — this is what lets BatchProcessor's thread pool
+            # actually overlap transcriptions.
+            model = self.model  # resolves the backend on first use
+
+            if self._backend == "faster":
+                if progress_callback:
+                    progress_callback(0.0)
+                result = self._transcribe_faster(audio_input, options)
+                if progress_callback:
+                    progress_callback(100.0)
+            elif progress_callback:
                 # Wrap the transcribe call to track progress
                 result = self._transcribe_with_progress(
-                    str(audio_path),
+                    audio_input,
                     options,
                     progress_callback
                 )
             else:
-                result = self.model.transcribe(str(audio_path), **options)
+                # The openai model is shared across instances and keeps
+                # per-call state on its modules, so inference on it is
+                # serialized; faster-whisper above runs lock-free
+                with self._infer_lock, torch.inference_mode():
+                    result = model.transcribe(audio_input, **options)
             
             # Calculate duration
-            duration = (datetime.now() - start_time).total_seconds()
+            duration = time.perf_counter() - start_time
             
             # Create result object
             transcription_result = TranscriptionResult(
@@ -182,7 +300,7 @@ class Transcriber:
                 segments=result.get("segments", []),
                 language=result.get("language", language),
                 duration=duration,
-                audio_path=str(audio_path),
+                audio_path=source,
                 model=self.model_name,
                 task=task
             )
@@ -192,11 +310,55 @@ class Transcriber:
             
         except Exception as e:
             logger.error(f"Transcription failed: {str(e)}")
-            raise TranscriptionError(f"Failed to transcribe {audio_path}: {str(e)}")
+            raise TranscriptionError(f"Failed to transcribe {source}: {str(e)}")
     
+    def _transcribe_faster(
+        self,
+        audio_input: Union[str, np.ndarray],
+        options: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Run faster-whisper and adapt its output to whisper's shape."""
+        opts = {k: v for k, v in options.items() if k != "verbose"}
+        opts["log_prob_threshold"] = opts.pop("logprob_threshold")
+
+        segment_iter, info = self.model.transcribe(audio_input, **opts)
+
+        # faster-whisper yields segments lazily; drain them into the
+        # dict shape the rest of the package expects
+        want_words = opts.get("word_timestamps", False)
+        segments = []
+        texts = []
+        for i, seg in enumerate(segment_iter):
+            segment = {
+                "id": i,
+                "start": seg.start,
+                "end": seg.end,
+                "text": seg.text
+            }
+            if want_words and seg.words is not None:
+                # Word objects -> dicts, matching the JSON-serializable
+                # per-word shape vanilla whisper emits
+                segment["words"] = [
+                    {
+                        "word": w.word,
+                        "start": w.start,
+                        "end": w.end,
+                        "probability": w.probability
+                    }
+                    for w in seg.words
+                ]
+            segments.append(segment)
+            texts.append(seg.text)
+
+        return {
+            "text": "".join(texts),
+            "segments": segments,
+            "language": info.language
+        }
+
     def _transcribe_with_progress(
         self,
-        audio_path: str,
+        audio_path: Union[str, np.ndarray],
         options: Dict[str, Any],
         progress_callback: Callable[[float], None]
     ) -> Dict[str, Any]:
@@ -204,7 +366,9 @@ class Transcriber:
         # This is a simplified version - in production you might want to
         # hook into Whisper's internal progress tracking
         progress_callback(0.0)
-        result = self.model.transcribe(audio_path, **options)
+        model = self.model
+        with self._infer_lock, torch.inference_mode():
+            result = model.transcribe(audio_path, **options)
         progress_callback(100.0)
         return result
     
@@ -223,23 +387,58 @@ class Transcriber:
             raise FileNotFoundError(f"Audio file not found: {audio_path}")
         
         logger.info(f"Detecting language for: {audio_path}")
-        
-        # Load audio
-        audio = whisper.load_audio(str(audio_path))
-        audio = whisper.pad_or_trim(audio)
-        
-        # Make log-Mel spectrogram
-        mel = whisper.log_mel_spectrogram(audio).to(self.device)
+
+        model = self.model
+
+        if self._backend == "faster":
+            # transcribe() returns before decoding any segments (the
+            # generator is lazy), so only the detection pass runs
+            _, info = model.transcribe(str(audio_path))
+            if info.all_language_probs:
+                sorted_probs = dict(sorted(
+                    info.all_language_probs,
+                    key=lambda x: x[1], reverse=True))
+            else:
+                sorted_probs = {info.language: info.language_probability}
+
+            logger.info(f"Detected language: {info.language} "
+                       f"(confidence: {info.language_probability:.2%})")
+            return sorted_probs
+
+        st = audio_path.stat()
+        key = (str(audio_path), st.st_mtime_ns, st.st_size)
+        mel = self._MEL_CACHE.get(key)
+
+        if mel is None:
+            # Load audio
+            audio = whisper.load_audio(str(audio_path))
+            audio = whisper.pad_or_trim(audio)
+
+            # Make log-Mel spectrogram
+            mel = whisper.log_mel_spectrogram(audio)
+
+            self._MEL_CACHE[key] = mel
+            if len(self._MEL_CACHE) > self._MEL_CACHE_SIZE:
+                self._MEL_CACHE.popitem(last=False)
+        else:
+            self._MEL_CACHE.move_to_end(key)
+
+        mel = mel.to(self.device)
         
         # Detect language
-        _, probs = self.model.detect_language(mel)
-        
-        # Sort by probability
-        sorted_probs = dict(sorted(probs.items(), key=lambda x: x[1], reverse=True))
-        
-        logger.info(f"Detected language: {list(sorted_probs.keys())[0]} "
-                   f"(confidence: {list(sorted_probs.values())[0]:.2%})")
+        with self._infer_lock, torch.inference_mode():
+            _, probs = model.detect_language(mel)
         
+        # Log the winner without materializing key/value lists; the
+        # fully sorted mapping is still built for the caller
+        top_lang, top_prob = max(probs.items(), key=itemgetter(1))
+
+        sorted_probs = dict(
+            sorted(probs.items(), key=itemgetter(1), reverse=True))
+
+        logger.info(f"Detected language: {top_lang} "
+                   f"(confidence: {top_prob:.2%})")
+
         return sorted_probs
     
     def batch_transcribe(
@@ -252,37 +451,92 @@ class Transcriber:
     ) -> List[TranscriptionResult]:
         """
         Transcribe multiple audio files.
-        
+
         Args:
             audio_paths: List of audio file paths
             output_dir: Directory to save transcriptions
             format: Output format
-            num_workers: Number of parallel workers (currently single-threaded)
+            num_workers: Number of decode prefetch threads; with more
+                than one, the next files are decoded on CPU while the
+                model transcribes the current one
             **transcribe_kwargs: Arguments passed to transcribe()
-            
+
         Returns:
             List of TranscriptionResult objects
         """
+        audio_paths = list(audio_paths)
         results = []
-        
-        for audio_path in tqdm(audio_paths, desc="Transcribing files"):
-            try:
-                result = self.transcribe(audio_path, **transcribe_kwargs)
-                results.append(result)
-                
-                # Save if output directory specified
-                if output_dir:
-                    output_path = Path(output_dir) / f"{Path(audio_path).stem}.{format}"
-                    result.save(output_path, format=format)
-                    
-            except Exception as e:
-                logger.error(f"Failed to transcribe {audio_path}: {str(e)}")
-                continue
-        
+
+        def save(result, audio_path):
+            if output_dir:
+                output_path = Path(output_dir) / f"{Path(audio_path).stem}.{format}"
+                result.save(output_path, format=format)
+
+        if num_workers <= 1:
+            for audio_path in tqdm(audio_paths, desc="Transcribing files"):
+                try:
+                    result = self.transcribe(audio_path, **transcribe_kwargs)
+                    results.append(result)
+                    save(result, audio_path)
+                except Exception as e:
+                    logger.error(f"Failed to transcribe {audio_path}: {str(e)}")
+                    continue
+
+            return results
+
+        # Prefetch decodes while the model runs: ffmpeg and the numpy
+        # conversion inside whisper.load_audio release the GIL, so the
+        # model never idles waiting for the next file to decode. The
+        # window stays bounded so only a few waveforms are resident.
+        from collections import deque
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(
+            max_workers=num_workers,
+            thread_name_prefix="green-needle-decode"
+        ) as pool:
+            pending_paths = iter(audio_paths)
+            window = deque()
+
+            def submit_next():
+                for audio_path in pending_paths:
+                    window.append(
+                        (audio_path,
+                         pool.submit(whisper.load_audio, str(audio_path)))
+                    )
+                    return
+
+            for _ in range(num_workers + 1):
+                submit_next()
+
+            with tqdm(total=len(audio_paths),
+                      desc="Transcribing files") as progress:
+                while window:
+                    audio_path, future = window.popleft()
+                    submit_next()
+                    try:
+                        audio = future.result()
+                        result = self.transcribe(audio, **transcribe_kwargs)
+                        # The decoded array carries no path, so the
+                        # result records a placeholder; restore the
+                        # real source file
+                        result.audio_path = str(audio_path)
+                        results.append(result)
+                        save(result, audio_path)
+                    except Exception as e:
+                        logger.error(
+                            f"Failed to transcribe {audio_path}: {str(e)}")
+                    finally:
+                        progress.update(1)
+
         return results
     
-    def __del__(self):
-        """Clean up resources."""
-        if hasattr(self, '_model') and self._model is not None:
-            del self._model
-            torch.cuda.empty_cache() if self.device == "cuda" else None
\ No newline at end of file
+
+def _release_cuda_cache():
+    """Finalizer: hand cached CUDA blocks back to the driver."""
+    try:
+        import torch
+        torch.cuda.empty_cache()
+    except Exception:
+        # Interpreter shutdown may already have torn torch down
+        pass
\ No newline at end of file
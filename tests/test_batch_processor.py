@@ -0,0 +1,121 @@
+"""Tests for the BatchProcessor class."""
+
+import threading
+import time
+
+import pytest
+
+import green_needle.batch_processor as batch_processor
+from green_needle.batch_processor import BatchProcessor, _ReportAccumulator
+
+
+class StubTranscriber:
+    """Stands in for Transcriber so pool tests skip model loading."""
+
+    instances = 0
+
+    def __init__(self, **kwargs):
+        type(self).instances += 1
+
+
+@pytest.fixture
+def stub_transcriber(monkeypatch):
+    """Replace the real Transcriber with the counting stub."""
+    StubTranscriber.instances = 0
+    monkeypatch.setattr(batch_processor, "Transcriber", StubTranscriber)
+    return StubTranscriber
+
+
+class TestTranscriberPool:
+    """Test cases for the bounded transcriber checkout pool."""
+
+    def test_concurrent_borrows_bounded_by_num_workers(self, stub_transcriber):
+        """Six concurrent borrows create exactly num_workers instances."""
+        num_workers = 2
+        processor = BatchProcessor(model="tiny", num_workers=num_workers)
+
+        active = 0
+        max_active = 0
+        counter_lock = threading.Lock()
+
+        def borrow():
+            nonlocal active, max_active
+            with processor._borrow_transcriber() as transcriber:
+                assert isinstance(transcriber, StubTranscriber)
+                with counter_lock:
+                    active += 1
+                    max_active = max(max_active, active)
+                time.sleep(0.02)
+                with counter_lock:
+                    active -= 1
+
+        threads = [threading.Thread(target=borrow) for _ in range(6)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert stub_transcriber.instances == num_workers
+        assert max_active <= num_workers
+
+    def test_borrowed_instances_are_reused(self, stub_transcriber):
+        """Sequential borrows check the same instance in and out."""
+        processor = BatchProcessor(model="tiny", num_workers=1)
+
+        with processor._borrow_transcriber() as first:
+            pass
+        with processor._borrow_transcriber() as second:
+            pass
+
+        assert first is second
+        assert stub_transcriber.instances == 1
+
+
+class TestReportAccumulator:
+    """Test cases for streaming report aggregation."""
+
+    def _success(self, **overrides):
+        result = {
+            'success': True,
+            'duration': 10.0,
+            'processing_time': 2.0,
+            'word_count': 100,
+            'language': 'en',
+        }
+        result.update(overrides)
+        return result
+
+    def test_add_folds_successes_and_failures(self):
+        """Totals, language counts and failures accumulate per add."""
+        acc = _ReportAccumulator()
+        acc.add(self._success())
+        acc.add(self._success(language='es', word_count=50))
+        acc.add({'success': False, 'file': 'bad.mp3', 'error': 'boom'})
+
+        assert acc.total_files == 3
+        assert acc.successful == 2
+        assert acc.failed == 1
+        assert acc.total_duration == 20.0
+        assert acc.total_words == 150
+        assert acc.languages == {'en': 1, 'es': 1}
+        assert acc.failures[0]['file'] == 'bad.mp3'
+
+    def test_generate_report_from_results_list(self):
+        """An explicit results list is folded and formatted."""
+        processor = BatchProcessor(model="tiny")
+        report = processor.generate_report([
+            self._success(),
+            {'success': False, 'file': 'bad.mp3', 'error': 'boom'},
+        ])
+
+        assert "Total files: 2" in report
+        assert "Successful: 1" in report
+        assert "- en: 1 files" in report
+        assert "- bad.mp3: boom" in report
+
+    def test_generate_report_without_arguments(self):
+        """With no prior batch, the no-arg path reports no successes."""
+        processor = BatchProcessor(model="tiny")
+        assert processor.generate_report() == (
+            "No files were successfully processed."
+        )
@@ -0,0 +1,55 @@
+"""Tests for configuration loading."""
+
+import pytest
+
+from green_needle.config import Config
+from green_needle.exceptions import ConfigError
+
+
+@pytest.fixture
+def config_file(tmp_path):
+    """Write a config file with the whisper section first."""
+    path = tmp_path / "config.yaml"
+    path.write_text(
+        "whisper:\n"
+        "  model: small\n"
+        "  language: en\n"
+        "processing:\n"
+        "  num_workers: 4\n"
+        "audio:\n"
+        "  sample_rate: 44100\n"
+    )
+    return path
+
+
+class TestFromFileHeader:
+    """Test cases for partial (header-only) config loading."""
+
+    def test_loads_leading_section(self, config_file):
+        """A section at the top of the file is parsed from the header."""
+        config = Config.from_file_header(config_file, sections=('whisper',))
+        assert config.whisper.model == "small"
+        assert config.whisper.language == "en"
+
+    def test_unrequested_sections_keep_defaults(self, config_file):
+        """Sections past the stop point are never applied."""
+        config = Config.from_file_header(config_file, sections=('whisper',))
+        assert config.processing.num_workers == 1
+        assert config.audio.sample_rate == 16000
+
+    def test_falls_back_to_full_parse(self, config_file):
+        """A requested section below an unrelated key still loads."""
+        config = Config.from_file_header(config_file, sections=('audio',))
+        assert config.audio.sample_rate == 44100
+
+    def test_missing_file_raises(self, tmp_path):
+        """A nonexistent path raises ConfigError, like from_file."""
+        with pytest.raises(ConfigError):
+            Config.from_file_header(tmp_path / "missing.yaml",
+                                    sections=('whisper',))
+
+    def test_matches_full_parse(self, config_file):
+        """Header loading agrees with from_file for the same section."""
+        partial = Config.from_file_header(config_file, sections=('whisper',))
+        full = Config.from_file(config_file)
+        assert partial.whisper == full.whisper
@@ -0,0 +1,69 @@
+"""Tests for utility functions."""
+
+import pytest
+
+from green_needle.utils import (
+    count_words,
+    format_size,
+    format_timestamp,
+    format_timestamps_bulk,
+)
+
+
+class TestCountWords:
+    """Test cases for the byte-scanning word counter."""
+
+    @pytest.mark.parametrize("text", [
+        "",
+        "hello",
+        "hello world",
+        "  leading and trailing  ",
+        "tabs\tand\nnewlines separate",
+        "múltiple idiomas 日本語 テスト",
+        "   ",
+    ])
+    def test_matches_split(self, text):
+        """count_words must agree with len(text.split())."""
+        assert count_words(text) == len(text.split())
+
+
+class TestFormatTimestampsBulk:
+    """Test cases for bulk timestamp formatting."""
+
+    @pytest.mark.parametrize("format", ["srt", "vtt"])
+    def test_matches_scalar_formatter(self, format):
+        """Bulk output must agree with format_timestamp per value."""
+        values = [0.0, 0.001, 1.5, 59.999, 61.25, 3599.5, 3661.042]
+        bulk = format_timestamps_bulk(values, format=format)
+        assert bulk == [format_timestamp(v, format=format) for v in values]
+
+    def test_empty_input(self):
+        """An empty iterable produces an empty list."""
+        assert format_timestamps_bulk([]) == []
+
+    def test_separator(self):
+        """SRT uses a comma, VTT a dot, before milliseconds."""
+        assert format_timestamps_bulk([1.5], format="srt") == ["00:00:01,500"]
+        assert format_timestamps_bulk([1.5], format="vtt") == ["00:00:01.500"]
+
+
+class TestFormatSize:
+    """Test cases for human-readable size formatting."""
+
+    @pytest.mark.parametrize("size,expected", [
+        (0, "0.0 B"),
+        (512, "512.0 B"),
+        (1023, "1023.0 B"),
+        (1024, "1.0 KB"),
+        (1536, "1.5 KB"),
+        (1024 ** 2, "1.0 MB"),
+        (5 * 1024 ** 3, "5.0 GB"),
+        (1024 ** 4, "1.0 TB"),
+    ])
+    def test_known_values(self, size, expected):
+        """Sizes land in the right unit with one decimal place."""
+        assert format_size(size) == expected
+
+    def test_does_not_overflow_units(self):
+        """Absurdly large sizes stay in the largest defined unit."""
+        assert format_size(1024 ** 7).endswith(" PB")